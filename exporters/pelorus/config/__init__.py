@@ -7,7 +7,7 @@ See [DEVELOPING](./DEVELOPING.md) for implementation details / dev docs.
 
 import logging
 import os
-from typing import Any, Generic, Mapping, Optional, Type, TypeVar
+from typing import Any, Generic, Mapping, Optional, Type, TypeVar, Union
 
 import attrs
 
@@ -15,31 +15,13 @@ from pelorus.config.loading import (
     MissingConfigDataError,
     MissingDataError,
     ValueWithSource,
-    _EnvFinder,
+    _class_plan,
+    _find_value,
     env_vars,
     no_env_vars,
 )
 from pelorus.config.log import LOG, REDACT, SKIP, Log, log
-from pelorus.utils import DEFAULT_VAR_KEYWORD
-
-
-def _prepare_kwargs(results: dict[str, Any]):
-    """
-    Handle the following cases:
-
-    Attrs removes underscores from field names for the init param names,
-    so we need to change the field names for the kwargs.
-
-    We wrap values in classes describing where they came from, so we need to unpack those.
-    """
-    for k, v in results.items():
-        if isinstance(v, ValueWithSource):
-            value = v.value
-        else:
-            value = v
-
-        yield k.lstrip("_"), value
-
+from pelorus.utils import get_default_keyword
 
 ConfigClass = TypeVar("ConfigClass")
 
@@ -57,54 +39,58 @@ class _LoggingLoader(Generic[ConfigClass]):
     default_keyword: str
     logger: logging.Logger
 
-    results: dict[str, Any] = attrs.field(factory=dict, init=False)
+    results: dict[str, Union[ValueWithSource, MissingDataError]] = attrs.field(
+        factory=dict, init=False
+    )
+    "What will be logged for each field. Skipped fields are left out."
     errors: list[MissingDataError] = attrs.field(factory=list, init=False)
+    kwargs: dict[str, Any] = attrs.field(factory=dict, init=False)
+    "The unwrapped values, by init param name. Only complete if there were no errors."
 
     def _load(self):
-        for field in attrs.fields(self.cls):  # type: ignore
-            if not field.init:
-                # field does not get set during instance creation,
-                # so don't load it.
-                continue
+        plans = _class_plan(self.cls)
+        results, errors, kwargs = self.results, self.errors, self.kwargs
+        env, other, default_keyword = self.env, self.other, self.default_keyword
 
-            name = field.name
-
-            value = _EnvFinder.get_value(
-                field, self.env, self.other, self.default_keyword
-            )
+        for plan in plans:
+            value = _find_value(plan, env, other, default_keyword)
 
             if isinstance(value, MissingDataError):
-                self.results[name] = value
-                self.errors.append(value)
+                results[plan.field.name] = value
+                errors.append(value)
             else:
-                self.results[name] = value
+                kwargs[plan.init_name] = value.value
+                if value.log is not SKIP:
+                    results[plan.field.name] = value
 
     def _log(self):
+        # One record per line: log collection is line-based,
+        # so each field keeps its own timestamp and level.
         if self.errors:
-            log_with_level = self.logger.error
-            log_with_level(
-                "While loading config %s, errors were encountered. All values:",
-                self.cls.__name__,
-            )
+            level = logging.ERROR
+            header = "While loading config %s, errors were encountered. All values:"
         else:
-            log_with_level = self.logger.info
-            log_with_level("Loading %s, inputs below:", self.cls.__name__)
+            level = logging.INFO
+            header = "Loading %s, inputs below:"
+
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+
+        logger.log(level, header, self.cls.__name__)
 
         for field, value in self.results.items():
             if isinstance(value, ValueWithSource):
-                if value.log is SKIP:
-                    continue
-
                 source = value.source()
 
                 if value.log is REDACT:
-                    value = "REDACTED"
+                    formatted = "REDACTED"
                 else:
-                    value = repr(value.value)
+                    formatted = repr(value.value)
 
-                log_with_level("%s=%s, %s", field, value, source)
+                logger.log(level, "%s=%s, %s", field, formatted, source)
             elif isinstance(value, MissingDataError):
-                log_with_level("%s=ERROR: %s", field, value)
+                logger.log(level, "%s=ERROR: %s", field, value)
 
     def load_and_log(self) -> ConfigClass:
         self._load()
@@ -113,9 +99,7 @@ class _LoggingLoader(Generic[ConfigClass]):
         if self.errors:
             raise MissingConfigDataError(self.cls.__name__, self.errors)
 
-        kwargs = dict(_prepare_kwargs(self.results))
-
-        return self.cls(**kwargs)  # type: ignore
+        return self.cls(**self.kwargs)  # type: ignore
 
 
 def load_and_log(
@@ -137,13 +121,14 @@ def load_and_log(
     env defaults to os.environ, and can be overridden for testing.
 
     default_keyword may be overridden. If the default of `None`,
-    the env var of `PELORUS_DEFAULT_KEYWORD` is used, falling back to "default".
+    the env var of `PELORUS_DEFAULT_KEYWORD` is used, falling back to "default"
+    (see `pelorus.utils.get_default_keyword`).
     This is looked up from `env`, not necessarily os.environ.
 
     logger defaults to the logger for `pelorus.config`, but may be overridden.
     """
     if default_keyword is None:
-        default = env.get("PELORUS_DEFAULT_KEYWORD", DEFAULT_VAR_KEYWORD)
+        default = get_default_keyword(env)
     else:
         default = default_keyword
 
@@ -1,4 +1,15 @@
-from typing import Any, Collection, Literal, Mapping, Optional, Sequence, Union
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import attrs
 from attrs import Attribute, frozen
@@ -25,6 +36,87 @@ def no_env_vars() -> Metadata:
     return {_ENV_LOOKUPS_KEY: tuple()}
 
 
+def _field_env_lookups(field: Attribute) -> tuple[str, ...]:
+    """
+    The env vars to check for this field, in order.
+    Defaults to the field's name in uppercase.
+    """
+    if _ENV_LOOKUPS_KEY in field.metadata:
+        return tuple(field.metadata[_ENV_LOOKUPS_KEY])
+    else:
+        return (field.name.upper(),)
+
+
+def _field_default(
+    field: Attribute,
+) -> tuple[Union[Any, Literal[NOTHING]], Optional[Callable[[], Any]]]:
+    """
+    Split the field's default into a plain default value and a factory.
+    Exactly one will be set if there is a default:
+    a value of `NOTHING` and a factory of `None` means there is no default.
+    """
+    default = field.default
+    if isinstance(default, Factory):
+        if default.takes_self:
+            raise ValueError(
+                f"Factories used for config loading cannot use takes_self ({field.name})"
+            )
+        return NOTHING, default.factory
+    else:
+        return default, None
+
+
+class _FieldPlan(NamedTuple):
+    """
+    How to load a field, derived from its metadata.
+    Fields and their metadata don't change after class creation,
+    so this is computed once per class instead of on every load.
+    """
+
+    field: Attribute
+    init_name: str
+    "The name of the init parameter, which attrs strips leading underscores from."
+    env_lookups: tuple[str, ...]
+    log: Log
+    "How to log a value loaded from the environment or a default."
+    other_log: Log
+    "How to log a value passed in through `other`."
+    default: Union[Any, Literal[NOTHING]]
+    default_factory: Optional[Callable[[], Any]]
+
+
+_class_plans: "weakref.WeakKeyDictionary[type, tuple[_FieldPlan, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+"Cache for `_class_plan`. Weak so classes that go away (e.g. defined in tests) don't leak."
+
+
+def _class_plan(cls: type) -> tuple[_FieldPlan, ...]:
+    """
+    The plan for loading each field of the attrs class, in field order.
+    Fields that aren't set during instance creation (`init=False`) are left out.
+    """
+    plan = _class_plans.get(cls)
+    if plan is None:
+        plan = _class_plans[cls] = _build_class_plan(cls)
+    return plan
+
+
+def _build_class_plan(cls: type) -> tuple[_FieldPlan, ...]:
+    return tuple(
+        _FieldPlan(
+            field,
+            field.name.lstrip("_"),
+            _field_env_lookups(field),
+            _should_log(field),
+            _get_log_meta(field.metadata) or SKIP,
+            *_field_default(field),
+        )
+        for field in attrs.fields(cls)  # type: ignore
+        if field.init
+    )
+
+
 # region: errors
 class MissingDataError(Exception):
     """
@@ -34,14 +126,15 @@ class MissingDataError(Exception):
     pass
 
 
-@frozen
 class MissingVariable(MissingDataError):
     """
     A required variable was missing.
     """
 
-    name: str
-    env_lookups: Sequence[str]
+    def __init__(self, name: str, env_lookups: Sequence[str]):
+        super().__init__(name, env_lookups)
+        self.name = name
+        self.env_lookups = env_lookups
 
     def __str__(self):
         if len(self.env_lookups) == 1:
@@ -52,15 +145,16 @@ class MissingVariable(MissingDataError):
         return f"{self.name} was not found in {env_lookup_str}"
 
 
-@frozen
 class MissingDefault(MissingDataError):
     """
     A variable was set to "default" but there was no default set.
     """
 
-    name: str
-    var_containing_default: str
-    default_keyword: str
+    def __init__(self, name: str, var_containing_default: str, default_keyword: str):
+        super().__init__(name, var_containing_default, default_keyword)
+        self.name = name
+        self.var_containing_default = var_containing_default
+        self.default_keyword = default_keyword
 
     def __str__(self):
         return (
@@ -69,13 +163,14 @@ class MissingDefault(MissingDataError):
         )
 
 
-@frozen
 class MissingOther(MissingDataError):
     """
     A variable had environment lookups disabled, but was not passed in `other`.
     """
 
-    name: str
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.name = name
 
     def __str__(self):
         return f"{self.name} had environment lookups disabled, but was not passed in to `load`'s `other` dict."
@@ -90,11 +185,17 @@ class MissingConfigDataError(Exception):
         super().__init__()
         self.config_class = config_class
         self.missing = missing
+        self._message: Optional[str] = None
 
     def __str__(self):
-        return f"Config for {self.config_class} is missing data: " + "\n".join(
-            str(x) for x in self.missing
-        )
+        # formatted on first use, since it's usually only needed when logged,
+        # but then may be formatted more than once (log message, traceback, etc.)
+        if self._message is None:
+            self._message = (
+                f"Config for {self.config_class} is missing data: "
+                + "\n".join(str(x) for x in self.missing)
+            )
+        return self._message
 
 
 # endregion
@@ -158,101 +259,78 @@ class OtherVar(ValueWithSource):
 # endregion
 
 
-@frozen
-class _EnvFinder:
-    "Load from environment or get default"
-    field: Attribute
-    env: Mapping[str, str]
-    env_lookups: tuple[str]
-    default_keyword: str
-    other: Mapping[str, Any]
-
-    @property
-    def name(self):
-        """
-        Field name.
-        """
-        return self.field.name
-
-    def _first_env_match(self) -> Optional[str]:
-        """
-        Return the _name_ of the first present env var.
-        Returns `None` if none were present.
-        """
-        for name in self.env_lookups:
-            if name in self.env:
-                return name
-        return None
-
-    def _get_default(self) -> Union[Any, Literal[NOTHING]]:
-        """
-        Get the default value for this field, invoking the attrs.Factory if necessary.
-        Returns `NOTHING` if there was no default defined.
-
-        """
-        default = self.field.default
-        if isinstance(default, Factory):
-            if default.takes_self:
-                raise ValueError(
-                    "Factories used for config loading cannot use takes_self"
-                )
-            return default.factory()
+# region: loading
+
+
+def _first_env_match(
+    env: Mapping[str, str], env_lookups: tuple[str, ...]
+) -> Optional[tuple[str, str]]:
+    """
+    Return the name and value of the first present env var.
+    Returns `None` if none were present.
+    """
+    for name in env_lookups:
+        value = env.get(name)
+        if value is not None:
+            return name, value
+    return None
+
+
+def _get_default(plan: _FieldPlan) -> Union[Any, Literal[NOTHING]]:
+    """
+    Get the default value for this field, invoking its factory if necessary.
+    Returns `NOTHING` if there was no default defined.
+    """
+    if plan.default_factory is not None:
+        return plan.default_factory()
+    else:
+        return plan.default
+
+
+def _find_value(
+    plan: _FieldPlan,
+    env: Mapping[str, str],
+    other: Mapping[str, Any],
+    default_keyword: str,
+) -> Union[ValueWithSource, MissingDataError]:
+    """
+    Loads the value from `other` or the environment, handling various default-fallback scenarios.
+    The value is wrapped with information about where it came from,
+    or the descriptive error for its absence is returned.
+    """
+    field, env_lookups, log = plan.field, plan.env_lookups, plan.log
+    name = field.name
+
+    other_value = other.get(name, NOTHING)
+    if other_value is not NOTHING:
+        return OtherVar(other_value, log=plan.other_log)
+    elif not env_lookups:
+        # should have been in other but was not.
+        return MissingOther(name)
+
+    match = _first_env_match(env, env_lookups)
+
+    if match is None:
+        value = _get_default(plan)
+        if value is NOTHING:
+            return MissingVariable(name, env_lookups)
         else:
-            return default
-
-    def _value_or_default(self) -> Union[ValueWithSource, MissingDataError]:
-        """
-        Get the value wrapped with information about where it came from,
-        or return the descriptive error for its absence.
-        """
-        if self.name in self.other:
-            return OtherVar(
-                self.other[self.name], log=_get_log_meta(self.field.metadata) or SKIP
-            )
-        elif not self.env_lookups:
-            # should have been in other but was not.
-            return MissingOther(self.name)
-
-        env_name = self._first_env_match()
-
-        if env_name is None:
-            value = self._get_default()
-            if value is NOTHING:
-                return MissingVariable(self.name, self.env_lookups)
-            else:
-                return UnsetEnvVar(
-                    value, env_lookups=self.env_lookups, log=_should_log(self.field)
-                )
-
-        value = self.env[env_name]
-        if value == self.default_keyword:
-            value = self._get_default()
-            if value is NOTHING:
-                return MissingDefault(self.name, env_name, self.default_keyword)
-            else:
-                return DefaultSetEnvVar(
-                    env_name=env_name,
-                    value=value,
-                    default_keyword=self.default_keyword,
-                    log=_should_log(self.field),
-                )
-
-        return FoundEnvVar(env_name=env_name, value=value, log=_should_log(self.field))
-
-    @classmethod
-    def get_value(
-        cls,
-        field: Attribute,
-        env: Mapping[str, str],
-        other: Mapping[str, Any],
-        default_keyword: str,
-    ) -> Union[ValueWithSource, MissingDataError]:
-        """
-        Loads the value from the environment, handling various default-fallback scenarios.
-        """
-        if _ENV_LOOKUPS_KEY in field.metadata:
-            env_lookups = field.metadata[_ENV_LOOKUPS_KEY]
+            return UnsetEnvVar(value, env_lookups=env_lookups, log=log)
+
+    env_name, value = match
+    if value == default_keyword:
+        value = _get_default(plan)
+        if value is NOTHING:
+            return MissingDefault(name, env_name, default_keyword)
         else:
-            env_lookups = (field.name.upper(),)
+            return DefaultSetEnvVar(
+                env_name=env_name,
+                value=value,
+                default_keyword=default_keyword,
+                log=log,
+            )
 
-        return cls(field, env, env_lookups, default_keyword, other)._value_or_default()
+    return FoundEnvVar(env_name=env_name, value=value, log=log)
+
+
+# endregion
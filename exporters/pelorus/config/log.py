@@ -1,4 +1,5 @@
 import enum
+import re
 from typing import Any, Mapping, Optional
 
 from attrs import Attribute
@@ -10,6 +11,11 @@ REDACT_WORDS = {"pass", "token", "key", "cred", "secret", "auth"}
 Variables containing these words are not logged by default, nor are attributes starting with an underscore.
 """
 
+_REDACT_PATTERN = re.compile(
+    "|".join(re.escape(word) for word in sorted(REDACT_WORDS)), re.IGNORECASE
+)
+"A single case-insensitive search for any of REDACT_WORDS."
+
 _SHOULD_LOG = "__pelorus_config_log"
 
 
@@ -57,7 +63,7 @@ def _should_log(field: Attribute) -> Log:
     if is_private:
         return Log.SKIP
 
-    should_be_redacted = any(word in field.name.lower() for word in REDACT_WORDS)
+    should_be_redacted = _REDACT_PATTERN.search(field.name) is not None
     if should_be_redacted:
         return Log.REDACT
 
@@ -55,7 +55,9 @@ See `README.md` in this directory.
 """
 from __future__ import annotations
 
+import functools
 import typing
+import weakref
 from typing import (
     Any,
     Iterable,
@@ -156,17 +158,37 @@ class Field(NamedTuple):
     metadata: dict[Any, Any]
 
 
-def _fields(cls: type["attr.AttrsInstance"]) -> Iterable[Field]:
-    "Get all field information for this attrs class."
+# Keyed weakly on the class being deserialized into, so an entry lives exactly
+# as long as its class does.
+_field_cache: "weakref.WeakKeyDictionary[type, tuple[Field, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _fields(cls: type["attr.AttrsInstance"]) -> tuple[Field, ...]:
+    """
+    Get all field information for this attrs class.
+
+    Cached, since it's needed for every instance deserialized
+    and resolving the type hints is expensive.
+    """
+    fields = _field_cache.get(cls)
+    if fields is None:
+        fields = _field_cache[cls] = _build_fields(cls)
+    return fields
+
+
+def _build_fields(cls: type["attr.AttrsInstance"]) -> tuple[Field, ...]:
     hints = get_type_hints(cls)
-    attrs_fields = attrs.fields(cls)
-    for field in attrs_fields:
-        yield Field(
+    return tuple(
+        Field(
             field.name,
             hints[field.name],
             default=field.default,
             metadata=field.metadata,
         )
+        for field in attrs.fields(cls)
+    )
 
 
 # endregion
@@ -178,7 +200,16 @@ def _fields(cls: type["attr.AttrsInstance"]) -> Iterable[Field]:
 # The origin in this case is `dict`, and the args are `(str, int)`.
 # This lets us inspect these types properly.
 
+# The same few types are inspected for every value deserialized
+# (every item in a list, for example), so the results are cached.
+# The keys are type annotations such as list[int], which are rebuilt as new
+# (equal) objects each time hints are resolved, so a weak cache would rarely hit.
+# Instead the caches are bounded: a program only uses a handful of these types,
+# and the bound keeps any that come and go (e.g. in tests) from piling up.
+_TYPE_CACHE_SIZE = 128
+
 
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
 def _extract_dict_types(type_: type) -> Optional[tuple[type, type]]:
     """
     If this type annotation is a dictionary-like, extract its key and value types.
@@ -201,6 +232,7 @@ def _extract_dict_types(type_: type) -> Optional[tuple[type, type]]:
     return args[0], args[1]
 
 
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
 def _extract_list_type(type_: type) -> Optional[type]:
     """
     If this type annotation is a list-like, extract its value type.
@@ -219,6 +251,7 @@ def _extract_list_type(type_: type) -> Optional[type]:
     return args[0]
 
 
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
 def _extract_optional_type(type_: type) -> Optional[type]:
     """
     If this type annotation is Optional[T], then returns the type T.
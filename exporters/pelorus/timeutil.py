@@ -1,7 +1,7 @@
 """
 Utilities to handle time correctly.
 
-Note: `parse_assuming_utc`, `parse_tz_aware`, and `parse_guessing_timezone_DYNAMIC`
+Note: `parse_assuming_utc`, `parse_iso_zulu`, `parse_tz_aware`, and `parse_guessing_timezone_DYNAMIC`
 will _always_ produce timezone-aware objects,
 which are necessary for correctness with `astimezone(tz)`, `timestamp()`, and other methods.
 """
@@ -33,6 +33,37 @@ def parse_assuming_utc(timestring: str, format: str) -> datetime:
         return parsed.replace(tzinfo=timezone.utc)
 
 
+def parse_iso_zulu(timestring: str) -> datetime:
+    """
+    Parses an ISO 8601 UTC timestring with a hard-coded Z, e.g. `2022-05-11T21:50:08Z`.
+    This is the inverse of `to_iso`.
+
+    Input with exactly that shape goes through `datetime.fromisoformat`
+    (implemented in C), which is much faster than `strptime`.
+    Everything else goes to `parse_assuming_utc`, so malformed input raises
+    a ValueError on every supported python version.
+    """
+    # fromisoformat accepts far more shapes than to_iso produces (and which shapes
+    # differs between python versions), so only use it for exactly YYYY-MM-DDTHH:MM:SSZ.
+    # It only understands a trailing Z starting in 3.11, so strip it.
+    if (
+        len(timestring) == 20
+        and timestring[4] == timestring[7] == "-"
+        and timestring[10] == "T"
+        and timestring[13] == timestring[16] == ":"
+        and timestring[19] == "Z"
+    ):
+        try:
+            parsed = datetime.fromisoformat(timestring[:-1])
+        except ValueError:
+            pass
+        else:
+            if not is_zone_aware(parsed):
+                return parsed.replace(tzinfo=timezone.utc)
+
+    return parse_assuming_utc(timestring, _ISO_ZULU_FMT)
+
+
 def parse_tz_aware(timestring: str, format: str) -> datetime:
     """
     Parses a timestring that includes its timezone information.
@@ -23,7 +23,7 @@ in kubernetes that are not so idiomatic to deal with.
 """
 import logging
 import os
-from typing import ClassVar, Generator, Optional, cast, overload
+from typing import ClassVar, Generator, Mapping, Optional, cast, overload
 
 import requests
 import requests.auth
@@ -44,6 +44,15 @@ from pelorus.utils.nested import (
 DEFAULT_VAR_KEYWORD = "default"
 
 
+def get_default_keyword(env: Mapping[str, str] = os.environ) -> str:
+    """
+    Get the keyword that means "use the default value" when an env var is set to it.
+    This is the value of PELORUS_DEFAULT_KEYWORD in `env` if it is set and non-empty,
+    otherwise DEFAULT_VAR_KEYWORD.
+    """
+    return env.get("PELORUS_DEFAULT_KEYWORD") or DEFAULT_VAR_KEYWORD
+
+
 class SpecializeDebugFormatter(logging.Formatter):
     """
     Uses a different format for DEBUG messages that has more information.
@@ -105,7 +114,7 @@ def get_env_var(var_name: str, default_value: Optional[str] = None) -> Optional[
     # | PELORUS_DEFAULT_KEYWORD | any str       | default_value |
     # | any other str           | None          | env var value |
     # | any other str           | any str       | env var value |
-    default_keyword = os.getenv("PELORUS_DEFAULT_KEYWORD") or DEFAULT_VAR_KEYWORD
+    default_keyword = get_default_keyword()
 
     env_var = os.getenv(var_name, default_value)
     if env_var == default_keyword:
@@ -266,6 +275,7 @@ class Url(urllib3.util.Url):
 __all__ = [
     "SpecializeDebugFormatter",
     "DEFAULT_VAR_KEYWORD",
+    "get_default_keyword",
     "get_env_var",
     "get_k8s_client",
     "TokenAuth",
@@ -133,14 +133,10 @@ def format_path(path: Sequence[str]) -> str:
 
     >>> assert format_path("foo.bar".split(".")) == "foo.bar"
     >>> assert format_path(["foo", "has.dots", "bar"]) == "foo[has.dots].bar"
+    >>> assert format_path([]) == ""
     """
-    formatted = ""
-    for part in path:
-        if "." in part:
-            formatted += f"[{part}]"
-        else:
-            formatted += f".{part}"
-    return formatted if formatted[0] != "." else formatted[1:]
+    formatted = "".join(f"[{part}]" if "." in part else f".{part}" for part in path)
+    return formatted[1:] if formatted.startswith(".") else formatted
 
 
 @attrs.frozen
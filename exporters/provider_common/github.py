@@ -7,8 +7,7 @@ from urllib.error import HTTPError
 import requests
 from attrs import frozen
 
-from pelorus.timeutil import parse_assuming_utc
-from pelorus.utils import BadAttributePathError, get_nested
+from pelorus.timeutil import parse_iso_zulu
 
 # The maximum number of requests you're permitted to make per hour.
 RATELIMIT_LIMIT_HEADER = "x-ratelimit-limit"
@@ -17,8 +16,6 @@ RATELIMIT_REMAINING_HEADER = "x-ratelimit-remaining"
 # The time at which the current rate limit window resets in UTC epoch seconds.
 RATELIMIT_RESET_HEADER = "x-ratelimit-reset"
 
-_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
-
 
 def parse_datetime(datetime_str: str) -> datetime:
     """
@@ -29,13 +26,18 @@ def parse_datetime(datetime_str: str) -> datetime:
 
     May throw a ValueError if it doesn't match the expected format.
     """
-    return parse_assuming_utc(datetime_str, format=_DATETIME_FORMAT)
+    return parse_iso_zulu(datetime_str)
 
 
-@frozen
 class GitHubError(Exception):
-    response: requests.Response
-    message: str = "Bad response from GitHub"
+    "An error talking to GitHub, with the response that caused it."
+
+    def __init__(
+        self, response: requests.Response, message: str = "Bad response from GitHub"
+    ):
+        self.response = response
+        self.message = message
+        super().__init__(message)
 
 
 def _log_and_validate_ratelimit(response: requests.Response):
@@ -45,12 +47,20 @@ def _log_and_validate_ratelimit(response: requests.Response):
 
     Will raise a GitHub error if there was a rate limit hit.
     """
+    # only a 403 is checked for a rate limit error.
+    # For anything else, the headers are only read if they'd be logged.
+    if response.status_code != 403 and not logging.getLogger().isEnabledFor(
+        logging.DEBUG
+    ):
+        return
+
     rate_limit_message = None
     try:
-        rate_limit = int(response.headers[RATELIMIT_LIMIT_HEADER])
-        remaining_requests = int(response.headers[RATELIMIT_REMAINING_HEADER])
+        headers = response.headers
+        rate_limit = int(headers[RATELIMIT_LIMIT_HEADER])
+        remaining_requests = int(headers[RATELIMIT_REMAINING_HEADER])
 
-        reset_time = response.headers[RATELIMIT_RESET_HEADER]
+        reset_time = headers[RATELIMIT_RESET_HEADER]
         reset_time = datetime.fromtimestamp(float(reset_time), timezone.utc)
 
         if response.status_code == 403:
@@ -134,7 +144,7 @@ def paginate_github_with_page(
     HTTPError if there's a bad response
     JSONDecodeError if there's a response with invalid JSON
     ValueError if a response was valid json but wasn't a list
-    BadAttributePathError if a response was missing a `next` link or the first was missing a `last` link.
+    KeyError if a response was missing a `next` link.
     """
     response = session.get(start_url)
     try:
@@ -142,7 +152,7 @@ def paginate_github_with_page(
 
         # if the last Link is not present, the response had all of the requested
         # items, and no pagination will occur.
-        last_url: str = get_nested(response.links, "last.url", default="")
+        last_url: str = response.links.get("last", {}).get("url", "")
 
         url = start_url
 
@@ -155,14 +165,14 @@ def paginate_github_with_page(
             if url == last_url:
                 break
 
-            url = get_nested(response.links, "next.url")
+            url = response.links["next"]["url"]
             response = session.get(url)
             json = _validate_github_response(response)
     except (
         HTTPError,
         requests.JSONDecodeError,
         ValueError,
-        BadAttributePathError,
+        KeyError,
     ) as e:
         raise GitHubError(response) from e
 
@@ -179,6 +189,6 @@ def paginate_github(session: requests.Session, start_url: str) -> Iterable:
     HTTPError if there's a bad response
     JSONDecodeError if there's a response with invalid JSON
     ValueError if a response was valid json but wasn't a list
-    BadAttributePathError if a response was missing a `next` link or the first was missing a `last` link.
+    KeyError if a response was missing a `next` link.
     """
     return chain.from_iterable(paginate_github_with_page(session, start_url))
@@ -1,12 +1,13 @@
+import logging
 from typing import Optional
 
 import pytest
-from attrs import define, field
+from attrs import Factory, define, field
 
 import pelorus
 from pelorus.config import load_and_log
 from pelorus.config.converters import comma_separated
-from pelorus.config.loading import env_vars, no_env_vars
+from pelorus.config.loading import MissingConfigDataError, env_vars, no_env_vars
 from pelorus.config.log import LOG, Log, log
 
 
@@ -134,3 +135,42 @@ def test_logging(caplog: pytest.LogCaptureFixture):
     assert "SHOULD BE ABSENT" not in logged
     for i in range(1, 6):
         assert f"LOG ME {i}" in logged
+
+
+def test_logging_errors_one_record_per_field(caplog: pytest.LogCaptureFixture):
+    @define
+    class Broken:
+        present: str
+        missing: str
+
+    with pytest.raises(MissingConfigDataError):
+        load_and_log(Broken, env=dict(PRESENT="here"))
+
+    messages = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+
+    assert any(m.startswith("present=") for m in messages)
+    assert any(m.startswith("missing=ERROR: ") for m in messages)
+
+
+def test_non_init_fields_not_loaded():
+    @define
+    class NonInit:
+        loaded: str
+        not_loaded: list[str] = field(factory=list, init=False)
+
+    env = dict(LOADED="loaded", NOT_LOADED="should not be used")
+
+    loaded = load_and_log(NonInit, env=env)
+
+    assert loaded.loaded == env["LOADED"]
+    assert loaded.not_loaded == []
+
+
+def test_factory_takes_self_rejected():
+    @define
+    class TakesSelf:
+        foo: str = "foo"
+        bar: str = field(default=Factory(lambda self: self.foo, takes_self=True))
+
+    with pytest.raises(ValueError):
+        load_and_log(TakesSelf, env=dict(BAR="bar"))
@@ -6,6 +6,7 @@ import provider_common.github as github
 from pelorus.timeutil import (
     parse_assuming_utc,
     parse_guessing_timezone_DYNAMIC,
+    parse_iso_zulu,
     parse_tz_aware,
     to_epoch_from_string,
 )
@@ -98,6 +99,37 @@ def test_dynamic_parsing_assumed():
     assert actual_parsed.timestamp() == UNIX
 
 
+@pytest.mark.parametrize(
+    "timestring, expected",
+    [
+        ("2022-05-11T21:50:08Z", datetime(2022, 5, 11, 21, 50, 8, tzinfo=timezone.utc)),
+        # not zero-padded, which only strptime handles
+        ("2020-06-27T03:17:8Z", datetime(2020, 6, 27, 3, 17, 8, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_iso_zulu(timestring: str, expected: datetime):
+    assert parse_iso_zulu(timestring) == expected
+
+
+@pytest.mark.parametrize(
+    "timestring",
+    [
+        "2022-05-11T21:50:08",
+        "2022-05-11T21:50:08+01:00Z",
+        "garbage",
+        "2022-05-11Z",
+        "2022-05-11T21:50Z",
+        "2022-05-11 21:50:08Z",
+        "20220511T215008Z",
+        "2022-05-11T21:50:08.5Z",
+        "2022-W19-3T21:50:08Z",
+    ],
+)
+def test_parse_iso_zulu_bad_value(timestring: str):
+    with pytest.raises(ValueError):
+        parse_iso_zulu(timestring)
+
+
 def test_github():
     TIMESTRING = "2022-05-11T21:50:08Z"
     EXPECTED_UNIX = 1652305808
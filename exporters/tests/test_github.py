@@ -0,0 +1,65 @@
+import json
+import logging
+
+import pytest
+import requests
+
+from provider_common.github import (
+    RATELIMIT_LIMIT_HEADER,
+    RATELIMIT_REMAINING_HEADER,
+    RATELIMIT_RESET_HEADER,
+    GitHubError,
+    _log_and_validate_ratelimit,
+)
+
+
+class UnreadableHeaders(dict):
+    def __getitem__(self, key):
+        raise AssertionError(f"header {key} should not have been read")
+
+    get = __getitem__
+
+
+def _response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.headers.update(
+        {
+            RATELIMIT_LIMIT_HEADER: "5000",
+            RATELIMIT_REMAINING_HEADER: "0",
+            RATELIMIT_RESET_HEADER: "1652305808",
+        }
+    )
+    return response
+
+
+def test_github_error_keeps_response_and_message():
+    response = _response(500, {})
+    error = GitHubError(response, "msg")
+
+    assert str(error) == "msg"
+    assert error.message == "msg"
+    assert error.response is response
+
+
+def test_ratelimit_403_raises_without_debug(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    message = "API rate limit exceeded for user ID 1."
+    response = _response(403, {"message": message})
+
+    with pytest.raises(GitHubError) as e:
+        _log_and_validate_ratelimit(response)
+
+    assert e.value.message == message
+    assert str(e.value) == message
+
+
+def test_ratelimit_ok_skips_headers_without_debug(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    response = _response(200, {})
+    response.headers = UnreadableHeaders()  # type: ignore
+
+    _log_and_validate_ratelimit(response)
+
+    assert not caplog.records
@@ -6,6 +6,7 @@ import pelorus
 from pelorus.utils import (
     BadAttributePathError,
     collect_bad_attribute_path_error,
+    get_default_keyword,
     get_env_var,
     get_nested,
 )
@@ -104,3 +105,15 @@ def test_env_var_default():
     assert (
         get_env_var("PELORUS_TEST_ENV_VAR_DEFAULT", "default_value") == "default_value"
     )
+
+
+@pytest.mark.parametrize(
+    "env,expected",
+    [
+        ({}, pelorus.utils.DEFAULT_VAR_KEYWORD),
+        ({"PELORUS_DEFAULT_KEYWORD": ""}, pelorus.utils.DEFAULT_VAR_KEYWORD),
+        ({"PELORUS_DEFAULT_KEYWORD": "custom"}, "custom"),
+    ],
+)
+def test_default_keyword(env: dict[str, str], expected: str):
+    assert get_default_keyword(env) == expected